@@ -1,9 +1,12 @@
 import discord
 from discord import app_commands, ui
-import requests
+import aiohttp
+import orjson
+import hashlib
 import os
+import sys
+import time
 import asyncio
-import threading
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 
@@ -18,6 +21,8 @@ JSONBIN_API_KEY = os.getenv("JSONBIN_API_KEY")
 BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 LOG_CHANNEL_ID = int(os.getenv("LOG_CHANNEL_ID", "0"))
 DEV_ID = int(os.getenv("DEV_DISCORD_ID", "0"))
+# Bot-owner permission set (single hash probe per check; add extra admin IDs here)
+ADMIN_IDS = frozenset(uid for uid in (DEV_ID,) if uid)
 ALLOWED_CHANNEL = int(os.getenv("ALLOWED_CHANNEL", "0"))
 
 # Point System - Pastebin URL
@@ -39,12 +44,27 @@ if missing_vars:
     raise Exception(f"Missing environment variables: {', '.join(missing_vars)}")
 
 JSONBIN_HEADERS = {
-    "Content-Type": "application/json",
+    "Content-Type": "application/json",  # required: payloads are sent pre-encoded via orjson
     "X-Master-Key": JSONBIN_API_KEY,
     "X-Bin-Meta": "false"
 }
 
-WHITELIST_PAUSED = False
+# Shared async HTTP session (keep-alive connection reuse for JSONBin),
+# created in MyBot.setup_hook once the event loop is running
+AIOHTTP_SESSION = None
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30)
+# Caps concurrent storage requests so bursts of syncs/loads can't exhaust
+# the connection pool; matches the connector limit in setup_hook
+IO_CONCURRENCY = 8
+IO_SEM = asyncio.Semaphore(IO_CONCURRENCY)
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session used for all storage calls"""
+    return AIOHTTP_SESSION
+
+# Whitelist pause flag: set() = paused. Only touched from the event loop, so a
+# loop-native asyncio.Event replaces the thread-safe (lock-backed) threading.Event
+_PAUSE = asyncio.Event()
 
 # ============================
 # RED THEME COLORS
@@ -58,134 +78,270 @@ COLOR_INFO = 0xCD5C5C        # Indian Red (Info)
 # ============================
 # LOCAL CACHE SYSTEM
 # ============================
-WHITELIST_CACHE = []
-CACHE_LOCK = threading.Lock()
+# All cache reads/writes happen on the bot's event loop thread, so no locks are
+# needed; syncs snapshot the cache on the loop before awaiting the PUT.
+WHITELIST_INDEX = {}  # {uid: entry}, insertion order matches JSONBin list order
+_EXPIRY_PRETTY = {}  # {uid: "DD - MM - YYYY"}, display-only; kept out of the persisted entries
 CACHE_LOADED = False
+_UID_SNAPSHOT = None  # tuple of entries for get_all_uids, reset on every mutation
+_LIST_FIELDS = None  # rendered list-view field blocks, reset on every mutation
+
+_last_etag = None  # ETag of the last full whitelist load, sent as If-None-Match
+_WHITELIST_DIRTY = False  # local whitelist changes not yet confirmed by a load or PUT
+_LOAD_LOCK = asyncio.Lock()  # one whitelist GET in flight at a time
+
+# Digest of the payload last loaded from / pushed to storage, per kind ("whitelist" / "points");
+# a sync whose payload matches is a no-op and skips the PUT
+_LAST_SYNCED = {}
+
+def _payload_digest(body: bytes) -> bytes:
+    return hashlib.blake2b(body, digest_size=16).digest()
 
 # Point System Cache
-POINTS_CACHE = {}  # {discord_user_id: points}
-POINTS_LOCK = threading.Lock()
+class Points:
+    """Per-user points record (slotted so extra per-user fields stay compact)"""
+    __slots__ = ("balance",)
+
+    def __init__(self, balance: int = 0):
+        self.balance = balance
 
-def load_cache_from_jsonbin():
-    """Load data from JSONBin to local cache (called once at startup)"""
-    global WHITELIST_CACHE, CACHE_LOADED
+_ZERO_POINTS = Points(0)  # shared read-only default for unknown users
+POINTS_CACHE = {}  # {discord_user_id: Points}
+
+async def load_cache_from_jsonbin():
+    """Load data from JSONBin to local cache; returns (success, "LOADED" | "NOT_MODIFIED" | "ERROR")"""
+    # Overlapping reloads queue here; the follow-up GET then revalidates against the
+    # fresh ETag and normally comes back as a cheap 304
+    async with _LOAD_LOCK:
+        return await _load_cache_from_jsonbin()
+
+async def _load_cache_from_jsonbin():
+    global WHITELIST_INDEX, _EXPIRY_PRETTY, CACHE_LOADED, _last_etag, _WHITELIST_DIRTY
+    # Conditional GET: an unchanged bin answers 304 with no body to download or parse.
+    # Only valid while the cache still equals what the bin holds; a pending or failed
+    # local write means the cache diverged, so fall back to a full GET
+    headers = {"If-None-Match": _last_etag} if _last_etag and CACHE_LOADED and not _WHITELIST_DIRTY else None
     try:
-        response = requests.get(JSONBIN_URL, headers=JSONBIN_HEADERS, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
-            with CACHE_LOCK:
-                WHITELIST_CACHE = data if isinstance(data, list) else []
+        async with IO_SEM, get_session().get(JSONBIN_URL, headers=headers, timeout=HTTP_TIMEOUT) as response:
+            if response.status == 304:
+                print(f"[CACHE] JSONBin unchanged, keeping {len(WHITELIST_INDEX)} cached entries")
+                return True, "NOT_MODIFIED"
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                entries = data if isinstance(data, list) else []
+                # Build into a local dict and swap it in only once the whole bin parsed,
+                # so a bad entry can never leave a half-filled index behind
+                index = {}
+                pretty = {}
+                for entry in entries:
+                    if not isinstance(entry, dict):
+                        continue
+                    uid = entry.get("uid")
+                    if isinstance(uid, int) and not isinstance(uid, bool):
+                        uid = str(uid)  # numeric UID edited in by hand; modal input is always str
+                    elif not isinstance(uid, str):
+                        continue
+                    # Interned UIDs share one object across cache, index and lookups
+                    entry["uid"] = uid = sys.intern(uid)
+                    # Display date is always derived from expiry_date, never trusted from storage
+                    # (older syncs persisted it; dropping it here cleans the bin on the next write)
+                    entry.pop("expiry_pretty", None)
+                    pretty[uid] = format_box_date(entry.get("expiry_date", ""))
+                    index[uid] = entry
+                WHITELIST_INDEX = index
+                _EXPIRY_PRETTY = pretty
+                _invalidate_snapshot()
+                _LAST_SYNCED["whitelist"] = _payload_digest(orjson.dumps(list(WHITELIST_INDEX.values())))
                 CACHE_LOADED = True
-            print(f"[CACHE] Loaded {len(WHITELIST_CACHE)} entries from JSONBin")
-            return True
-        else:
-            print(f"[CACHE] Error loading: {response.status_code}")
-            return False
+                _WHITELIST_DIRTY = False
+                _last_etag = response.headers.get("ETag")
+                print(f"[CACHE] Loaded {len(WHITELIST_INDEX)} entries from JSONBin")
+                return True, "LOADED"
+            else:
+                print(f"[CACHE] Error loading: {response.status}")
+                return False, "ERROR"
     except Exception as e:
         print(f"[CACHE] Error loading from JSONBin: {e}")
-        return False
+        return False, "ERROR"
 
-def sync_cache_to_jsonbin():
-    """Sync local cache to JSONBin (background task)"""
+async def sync_cache_to_jsonbin():
+    """Sync local cache to JSONBin (runs as a task on the bot's event loop)"""
+    global _WHITELIST_DIRTY, _last_etag
     try:
-        with CACHE_LOCK:
-            data_to_sync = WHITELIST_CACHE.copy()
-        
-        response = requests.put(JSONBIN_URL, headers=JSONBIN_HEADERS, json=data_to_sync, timeout=30)
-        if response.status_code == 200:
-            print(f"[SYNC] Successfully synced {len(data_to_sync)} entries to JSONBin")
+        data_to_sync = list(WHITELIST_INDEX.values())
+        body = orjson.dumps(data_to_sync)
+        digest = _payload_digest(body)
+        # The body is snapshotted here; a mutation during the PUT marks the cache dirty again
+        _WHITELIST_DIRTY = False
+        if _LAST_SYNCED.get("whitelist") == digest:
+            print("[SYNC] Whitelist unchanged, skipping JSONBin write")
             return True
-        else:
-            print(f"[SYNC] Error syncing: {response.status_code}")
-            return False
+        
+        # Our own write changes the bin's ETag, so the old one must not be revalidated
+        _last_etag = None
+        async with IO_SEM, get_session().put(JSONBIN_URL, data=body, timeout=HTTP_TIMEOUT) as response:
+            if response.status == 200:
+                _LAST_SYNCED["whitelist"] = digest
+                _last_etag = response.headers.get("ETag")
+                print(f"[SYNC] Successfully synced {len(data_to_sync)} entries to JSONBin")
+                return True
+            else:
+                _WHITELIST_DIRTY = True
+                print(f"[SYNC] Error syncing: {response.status}")
+                return False
     except Exception as e:
+        _WHITELIST_DIRTY = True
         print(f"[SYNC] Error syncing to JSONBin: {e}")
         return False
 
+# Strong references to running background tasks so they are not garbage collected
+_BACKGROUND_TASKS = set()
+
+def _on_task_done(task):
+    """Drop the task reference and report any exception nobody will await"""
+    _BACKGROUND_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        name = getattr(task.get_coro(), "__qualname__", task.get_name())
+        print(f"[TASK] Background task {name} failed: {task.exception()!r}")
+
+def _spawn_task(coro):
+    """Run a coroutine as a background task on the event loop; returns the task"""
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
+
+# Debounced sync: mutations enqueue the cache kind ("whitelist" / "points") once,
+# and a single worker does one PUT per kind per burst
+SYNC_DEBOUNCE = 0.25  # seconds
+SYNC_RETRY_MAX = 60  # seconds, cap for the backoff after a failed PUT
+_SYNC_QUEUE = asyncio.Queue()  # unbounded; _SYNC_PENDING keeps it to one item per kind
+_SYNC_PENDING = set()  # kinds already queued, so repeat mutations don't re-enqueue
+
+def _request_sync(kind: str):
+    if kind in _SYNC_PENDING:
+        return
+    _SYNC_QUEUE.put_nowait(kind)
+    _SYNC_PENDING.add(kind)
+
+async def _run_sync(kind: str) -> bool:
+    # Discard first so a mutation during the PUT queues a fresh sync
+    _SYNC_PENDING.discard(kind)
+    try:
+        if kind == "whitelist":
+            return await sync_cache_to_jsonbin()
+        elif kind == "points":
+            return await sync_points_to_storage()
+        return True
+    except asyncio.CancelledError:
+        # Shutdown aborted the PUT; keep the kind pending so close() flushes it
+        _request_sync(kind)
+        raise
+
+async def sync_worker():
+    """Wait for mutations, let the burst settle, then PUT each dirty cache once"""
+    retry_delay = SYNC_DEBOUNCE
+    while True:
+        kinds = [await _SYNC_QUEUE.get()]
+        await asyncio.sleep(SYNC_DEBOUNCE)
+        while not _SYNC_QUEUE.empty():
+            kinds.append(_SYNC_QUEUE.get_nowait())
+        failed = False
+        for kind in kinds:
+            if not await _run_sync(kind):
+                # Re-queue right away so the change stays pending (and is flushed on shutdown)
+                _request_sync(kind)
+                failed = True
+        if failed:
+            retry_delay = min(retry_delay * 2, SYNC_RETRY_MAX)
+            print(f"[SYNC] Retrying failed sync in {retry_delay:g}s")
+            await asyncio.sleep(retry_delay)
+        else:
+            retry_delay = SYNC_DEBOUNCE
+
+async def flush_pending_syncs():
+    """Push any changes still waiting in the debounce window (used on shutdown)"""
+    for kind in list(_SYNC_PENDING):
+        await _run_sync(kind)
+
 def sync_in_background():
-    """Run sync in a separate thread to not block the bot"""
-    thread = threading.Thread(target=sync_cache_to_jsonbin)
-    thread.start()
+    """Mark the whitelist dirty and queue a sync; the sync worker will push it to JSONBin"""
+    global _WHITELIST_DIRTY
+    _WHITELIST_DIRTY = True
+    _request_sync("whitelist")
 
 # ============================
 # POINTS SYSTEM FUNCTIONS
 # ============================
 
-# JSONBin Headers for Points (same API key)
-POINTS_HEADERS = {
-    "Content-Type": "application/json",
-    "X-Master-Key": JSONBIN_API_KEY,
-    "X-Bin-Meta": "false"
-}
+# Points storage uses the same JSONBin API key (headers set on the shared session)
 
-def load_points_from_storage():
+async def load_points_from_storage():
     """Load points data from storage"""
     global POINTS_CACHE
     try:
-        response = requests.get(POINTS_URL, headers=POINTS_HEADERS, timeout=30)
-        if response.status_code == 200:
-            data = response.json()
-            with POINTS_LOCK:
-                POINTS_CACHE = data if isinstance(data, dict) else {}
-            print(f"[POINTS] Loaded {len(POINTS_CACHE)} user points")
-            return True
-        else:
-            print(f"[POINTS] Error loading: {response.status_code}")
-            return False
+        async with IO_SEM, get_session().get(POINTS_URL, timeout=HTTP_TIMEOUT) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                POINTS_CACHE = {sys.intern(k): Points(v) for k, v in data.items()} if isinstance(data, dict) else {}
+                _LAST_SYNCED["points"] = _payload_digest(orjson.dumps({k: p.balance for k, p in POINTS_CACHE.items()}))
+                print(f"[POINTS] Loaded {len(POINTS_CACHE)} user points")
+                return True
+            else:
+                print(f"[POINTS] Error loading: {response.status}")
+                return False
     except Exception as e:
         print(f"[POINTS] Error loading points: {e}")
         return False
 
-def sync_points_to_storage():
-    """Sync points cache to storage"""
+async def sync_points_to_storage():
+    """Sync points cache to storage (runs as a task on the bot's event loop)"""
     try:
-        with POINTS_LOCK:
-            data_to_sync = POINTS_CACHE.copy()
-        
-        response = requests.put(POINTS_URL, headers=POINTS_HEADERS, json=data_to_sync, timeout=30)
-        if response.status_code == 200:
-            print(f"[POINTS] Synced {len(data_to_sync)} user points")
+        data_to_sync = {user_id: points.balance for user_id, points in POINTS_CACHE.items()}
+        body = orjson.dumps(data_to_sync)
+        digest = _payload_digest(body)
+        if _LAST_SYNCED.get("points") == digest:
+            print("[POINTS] Points unchanged, skipping storage write")
             return True
-        else:
-            print(f"[POINTS] Error syncing: {response.status_code}")
-            return False
+        
+        async with IO_SEM, get_session().put(POINTS_URL, data=body, timeout=HTTP_TIMEOUT) as response:
+            if response.status == 200:
+                _LAST_SYNCED["points"] = digest
+                print(f"[POINTS] Synced {len(data_to_sync)} user points")
+                return True
+            else:
+                print(f"[POINTS] Error syncing: {response.status}")
+                return False
     except Exception as e:
         print(f"[POINTS] Error syncing points: {e}")
         return False
 
 def sync_points_in_background():
-    """Run points sync in background"""
-    thread = threading.Thread(target=sync_points_to_storage)
-    thread.start()
+    """Queue a points sync; the sync worker will push it to storage"""
+    _request_sync("points")
 
+# Points helpers take the Discord user id already converted to str by the caller
 def get_user_points(user_id: str) -> int:
     """Get points for a user (instant from cache)"""
-    with POINTS_LOCK:
-        return POINTS_CACHE.get(str(user_id), 0)
+    return POINTS_CACHE.get(user_id, _ZERO_POINTS).balance
 
 def add_user_points(user_id: str, amount: int) -> int:
     """Add points to a user and return new balance"""
-    global POINTS_CACHE
-    with POINTS_LOCK:
-        user_id = str(user_id)
-        current = POINTS_CACHE.get(user_id, 0)
-        new_balance = current + amount
-        POINTS_CACHE[user_id] = new_balance
+    points = POINTS_CACHE.get(user_id)
+    if points is None:
+        points = POINTS_CACHE[sys.intern(user_id)] = Points()
+    points.balance += amount
     sync_points_in_background()
-    return new_balance
+    return points.balance
 
 def deduct_user_points(user_id: str, amount: int) -> tuple[bool, int]:
     """Deduct points from user. Returns (success, remaining_balance)"""
-    global POINTS_CACHE
-    with POINTS_LOCK:
-        user_id = str(user_id)
-        current = POINTS_CACHE.get(user_id, 0)
-        if current < amount:
-            return False, current
-        new_balance = current - amount
-        POINTS_CACHE[user_id] = new_balance
+    points = POINTS_CACHE.get(user_id)
+    if points is None or points.balance < amount:
+        return False, points.balance if points else 0
+    points.balance -= amount
     sync_points_in_background()
-    return True, new_balance
+    return True, points.balance
 
 def calculate_points_needed(days: int) -> int:
     """Calculate points needed for given days"""
@@ -194,164 +350,323 @@ def calculate_points_needed(days: int) -> int:
 # ============================
 # FAST CACHE FUNCTIONS (NO API CALLS)
 # ============================
+def _invalidate_snapshot():
+    global _UID_SNAPSHOT, _LIST_FIELDS
+    _UID_SNAPSHOT = None
+    _LIST_FIELDS = None
+
 def get_uid_entry(uid):
-    """Get specific UID entry from local cache (instant)"""
-    with CACHE_LOCK:
-        for entry in WHITELIST_CACHE:
-            if entry.get("uid") == uid:
-                return entry.copy()
-    return None
+    """Get specific UID entry from local cache (instant), as a display copy with expiry_pretty"""
+    entry = WHITELIST_INDEX.get(uid)
+    return dict(entry, expiry_pretty=_EXPIRY_PRETTY[uid]) if entry else None
 
 def add_uid_entry(uid, expiry, comment):
-    """Add or update UID entry in local cache, then sync in background"""
-    global WHITELIST_CACHE
+    """Add or update UID entry in local cache, then sync in background. Returns (display copy, was_update)"""
+    uid = sys.intern(uid)
+    was_update = uid in WHITELIST_INDEX
+    new_entry = {
+        "uid": uid,
+        "expiry_date": expiry,
+        "comment": comment
+    }
     
-    with CACHE_LOCK:
-        existing_index = -1
-        for i, entry in enumerate(WHITELIST_CACHE):
-            if entry.get("uid") == uid:
-                existing_index = i
-                break
-        
-        new_entry = {
-            "uid": uid,
-            "expiry_date": expiry,
-            "comment": comment
-        }
-        
-        if existing_index >= 0:
-            WHITELIST_CACHE[existing_index] = new_entry
-        else:
-            WHITELIST_CACHE.append(new_entry)
+    WHITELIST_INDEX[uid] = new_entry
+    _EXPIRY_PRETTY[uid] = pretty = format_box_date(expiry)
+    _invalidate_snapshot()
     
     # Sync to JSONBin in background
     sync_in_background()
-    return True
+    return dict(new_entry, expiry_pretty=pretty), was_update
 
 def remove_uid_entry(uid):
     """Remove UID entry from local cache, then sync in background"""
-    global WHITELIST_CACHE
-    
-    with CACHE_LOCK:
-        original_len = len(WHITELIST_CACHE)
-        WHITELIST_CACHE = [entry for entry in WHITELIST_CACHE if entry.get("uid") != uid]
-        removed = len(WHITELIST_CACHE) != original_len
+    removed = WHITELIST_INDEX.pop(uid, None) is not None
     
     if removed:
+        _EXPIRY_PRETTY.pop(uid, None)
+        _invalidate_snapshot()
         sync_in_background()
         return True
     return False
 
 def change_uid_entry(old_uid, new_uid):
     """Change UID from old to new in local cache, then sync in background"""
-    global WHITELIST_CACHE
-    
-    with CACHE_LOCK:
-        # Check if new UID already exists
-        for entry in WHITELIST_CACHE:
-            if entry.get("uid") == new_uid:
-                return False, "NEW_UID_EXISTS"
+    global WHITELIST_INDEX
+    # Check if new UID already exists
+    if new_uid in WHITELIST_INDEX:
+        return False, "NEW_UID_EXISTS"
+        
+    entry = WHITELIST_INDEX.get(old_uid)
+    if entry is None:
+        return False, "OLD_UID_NOT_FOUND"
         
-        # Find and update old UID
-        for entry in WHITELIST_CACHE:
-            if entry.get("uid") == old_uid:
-                entry["uid"] = new_uid
-                sync_in_background()
-                return True, "SUCCESS"
+    new_uid = sys.intern(new_uid)
+    entry["uid"] = new_uid
+    # Rebuild the index rather than pop + re-insert: that would be O(1) but move the entry
+    # to the end of the list view and of JSONBin. Keeping its position costs one O(n) pass,
+    # which is fine for a rare admin action
+    WHITELIST_INDEX = {
+        (new_uid if uid == old_uid else uid): e for uid, e in WHITELIST_INDEX.items()
+    }
+    _EXPIRY_PRETTY[new_uid] = _EXPIRY_PRETTY.pop(old_uid)
+    _invalidate_snapshot()
     
-    return False, "OLD_UID_NOT_FOUND"
+    sync_in_background()
+    return True, "SUCCESS"
 
 def get_all_uids():
-    """Get all UID entries from local cache (instant)"""
-    with CACHE_LOCK:
-        return WHITELIST_CACHE.copy()
+    """Get all UID entries as a read-only tuple, rebuilt only after the cache changes"""
+    global _UID_SNAPSHOT
+    if _UID_SNAPSHOT is None:
+        _UID_SNAPSHOT = tuple(WHITELIST_INDEX.values())
+    return _UID_SNAPSHOT
+
+def get_list_fields():
+    """Get the list-view field values (max 1000 chars each), rendered once per cache change"""
+    global _LIST_FIELDS
+    if _LIST_FIELDS is None:
+        fields = []
+        pretty = _EXPIRY_PRETTY
+        # Collect lines per block and join once (repeated += would recopy the block)
+        chunks = []
+        size = 0
+        for entry in get_all_uids():
+            line = f"`{entry['uid']}` - {pretty[entry['uid']]} - {entry.get('comment', '')}\n"
+            if size + len(line) > 1000 and chunks:
+                fields.append("".join(chunks))
+                chunks = [line]
+                size = len(line)
+            else:
+                chunks.append(line)
+                size += len(line)
+        
+        if chunks:
+            fields.append("".join(chunks))
+        _LIST_FIELDS = fields
+    return _LIST_FIELDS
 
 # ============================
 # LOGGING SYSTEM
 # ============================
+_LOG_CHANNEL = None  # resolved once in on_ready
+
+def get_log_channel(bot):
+    """Return the cached log channel, resolving it on first use if on_ready hasn't yet"""
+    global _LOG_CHANNEL
+    if _LOG_CHANNEL is None:
+        _LOG_CHANNEL = bot.get_channel(LOG_CHANNEL_ID)
+    return _LOG_CHANNEL
+
+# action -> (title, color, actor field label, extra fields builder)
+_LOG_TEMPLATES = {
+    "ADD": ("🔴 UID ADDED", COLOR_SUCCESS, "Added By",
+            lambda uid, expiry, comment, old_uid: [("UID", f"`{uid}`"), ("Expiry", f"`{expiry}`"), ("Comment", f"`{comment}`")]),
+    "REMOVE": ("❌ UID REMOVED", COLOR_ERROR, "Removed By",
+               lambda uid, expiry, comment, old_uid: [("UID", f"`{uid}`")]),
+    "CHANGE": ("🔄 UID CHANGED", COLOR_WARNING, "Changed By",
+               lambda uid, expiry, comment, old_uid: [("Old UID", f"`{old_uid}`"), ("New UID", f"`{uid}`")]),
+    "PAUSE": ("⏸️ SYSTEM PAUSED", COLOR_WARNING, "Action By",
+              lambda uid, expiry, comment, old_uid: []),
+    "RESUME": ("▶️ SYSTEM RESUMED", COLOR_SUCCESS, "Action By",
+               lambda uid, expiry, comment, old_uid: []),
+}
+
 async def send_log(bot, action: str, uid: str, user: discord.User, expiry: str = None, comment: str = None, old_uid: str = None):
     """Enhanced logging function with formatted messages"""
     if not LOG_CHANNEL_ID:
         return
         
-    ch = bot.get_channel(LOG_CHANNEL_ID)
-    if not ch:
+    ch = get_log_channel(bot)
+    template = _LOG_TEMPLATES.get(action)
+    if not ch or not template:
         return
 
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    title, color, actor_label, build_fields = template
+    # Discord renders <t:unix> in each viewer's own timezone, so no server-side formatting
+    unix = int(time.time())
     
-    if action == "ADD":
-        embed = discord.Embed(
-            title="🔴 UID ADDED",
-            color=COLOR_SUCCESS,
-            timestamp=datetime.now()
-        )
-        embed.add_field(name="UID", value=f"`{uid}`", inline=True)
-        embed.add_field(name="Expiry", value=f"`{expiry}`", inline=True)
-        embed.add_field(name="Comment", value=f"`{comment}`", inline=True)
-        embed.add_field(name="Added By", value=f"`{user.name}`\n(`{user.id}`)", inline=True)
-        embed.add_field(name="Timestamp", value=f"`{current_time}`", inline=True)
-        
-    elif action == "REMOVE":
-        embed = discord.Embed(
-            title="❌ UID REMOVED",
-            color=COLOR_ERROR,
-            timestamp=datetime.now()
-        )
-        embed.add_field(name="UID", value=f"`{uid}`", inline=True)
-        embed.add_field(name="Removed By", value=f"`{user.name}`\n(`{user.id}`)", inline=True)
-        embed.add_field(name="Timestamp", value=f"`{current_time}`", inline=True)
-        
-    elif action == "CHANGE":
-        embed = discord.Embed(
-            title="🔄 UID CHANGED",
-            color=COLOR_WARNING,
-            timestamp=datetime.now()
-        )
-        embed.add_field(name="Old UID", value=f"`{old_uid}`", inline=True)
-        embed.add_field(name="New UID", value=f"`{uid}`", inline=True)
-        embed.add_field(name="Changed By", value=f"`{user.name}`\n(`{user.id}`)", inline=True)
-        embed.add_field(name="Timestamp", value=f"`{current_time}`", inline=True)
-        
-    elif action == "PAUSE":
-        embed = discord.Embed(
-            title="⏸️ SYSTEM PAUSED",
-            color=COLOR_WARNING,
-            timestamp=datetime.now()
-        )
-        embed.add_field(name="Action By", value=f"`{user.name}`\n(`{user.id}`)", inline=True)
-        embed.add_field(name="Timestamp", value=f"`{current_time}`", inline=True)
-        
-    elif action == "RESUME":
-        embed = discord.Embed(
-            title="▶️ SYSTEM RESUMED",
-            color=COLOR_SUCCESS,
-            timestamp=datetime.now()
-        )
-        embed.add_field(name="Action By", value=f"`{user.name}`\n(`{user.id}`)", inline=True)
-        embed.add_field(name="Timestamp", value=f"`{current_time}`", inline=True)
-    
-    embed.set_footer(text="🔴 Whitelist System")
-    await ch.send(embed=embed)
+    fields = build_fields(uid, expiry, comment, old_uid)
+    fields.append((actor_label, f"`{user.name}`\n(`{user.id}`)"))
+    fields.append(("Timestamp", f"<t:{unix}:F>"))
+    embed = make_embed(title, color, fields=fields, footer="🔴 Whitelist System")
+    try:
+        await ch.send(embed=embed)
+    except Exception as e:
+        # Usually runs as a background task, so report instead of raising
+        print(f"[LOG] Error sending log: {e}")
 
 async def send_simple_log(bot, message: str):
     """Simple text-based log"""
     if not LOG_CHANNEL_ID:
         return
         
-    ch = bot.get_channel(LOG_CHANNEL_ID)
+    ch = get_log_channel(bot)
     if ch:
-        await ch.send(f"`{datetime.now().strftime('%H:%M:%S')}` {message}")
+        try:
+            await ch.send(f"<t:{int(time.time())}:T> {message}")
+        except Exception as e:
+            print(f"[LOG] Error sending log: {e}")
 
 # ============================
 # FORMAT DATE
 # ============================
 def format_box_date(raw):
+    """YYYY-MM-DD -> DD - MM - YYYY by fixed-width slicing; anything else is returned as-is"""
+    if isinstance(raw, str) and len(raw) == 10 and raw[4] == "-" and raw[7] == "-":
+        return f"{raw[8:10]} - {raw[5:7]} - {raw[0:4]}"
+    return raw
+
+def make_embed(title, color, description=None, fields=(), footer=None):
+    """Build an embed in one shot; fields are (name, value) or (name, value, inline) tuples"""
+    # One Embed.from_dict call instead of the constructor plus an add_field() per field
+    payload = {
+        "type": "rich",
+        "title": title,
+        "color": color,
+        "fields": [
+            {"name": field[0], "value": field[1], "inline": field[2] if len(field) > 2 else True}
+            for field in fields
+        ],
+    }
+    if description is not None:
+        payload["description"] = description
+    if footer:
+        payload["footer"] = {"text": footer}
+    return discord.Embed.from_dict(payload)
+
+def is_ascii_digits(text, max_len, min_len=1):
+    """Cheap numeric input check (avoids int() raising ValueError on bad input)"""
+    return text.isascii() and text.isdigit() and min_len <= len(text) <= max_len
+
+def parse_modal_int(text):
+    """Parse a numeric modal field as int(), or None when it is not a number"""
+    # Plain ASCII digits (the common case) skip the exception setup; anything else
+    # still goes through int(), so Thai numerals like "๓๐" and "-5" parse as before
+    if text.isascii() and text.isdigit():
+        return int(text)
     try:
-        y, m, d = raw.split("-")
-        return f"{d} - {m} - {y}"
-    except:
-        return raw
+        return int(text)
+    except ValueError:
+        return None
+
+# Shared static embeds, built once; never mutate these after creation
+EMBED_NO_PERMISSION_PAUSE = make_embed(
+    "❌ ไม่มีสิทธิ์", COLOR_ERROR,
+    description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถหยุดระบบได้"
+)
+EMBED_NO_PERMISSION_RESUME = make_embed(
+    "❌ ไม่มีสิทธิ์", COLOR_ERROR,
+    description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถเปิดระบบได้"
+)
+EMBED_NO_PERMISSION_SYNC = make_embed(
+    "❌ ไม่มีสิทธิ์", COLOR_ERROR,
+    description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถ Sync ข้อมูลได้"
+)
+EMBED_NO_PERMISSION_ADD_POINTS = make_embed(
+    "❌ ไม่มีสิทธิ์", COLOR_ERROR,
+    description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถเพิ่ม points ได้"
+)
+EMBED_NO_PERMISSION_CHECK_POINTS = make_embed(
+    "❌ ไม่มีสิทธิ์", COLOR_ERROR,
+    description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถดู points ของผู้อื่นได้"
+)
+EMBED_NO_PERMISSION_SERVER_OWNER = make_embed(
+    "❌ ไม่มีสิทธิ์", COLOR_ERROR,
+    description="เฉพาะเจ้าของเซิร์ฟเวอร์เท่านั้นที่สามารถเพิ่ม Points ได้"
+)
+EMBED_POINTS_DISABLED = make_embed(
+    "⚠️ ระบบ Points ไม่เปิดใช้งาน", COLOR_WARNING,
+    description="กรุณาตั้งค่า POINTS_URL ใน .env"
+)
+# User-facing variant (menu button) - no operator hint about .env
+EMBED_POINTS_DISABLED_USER = make_embed(
+    "⚠️ ระบบ Points ไม่เปิดใช้งาน", COLOR_WARNING,
+    description="ระบบ Points ไม่ได้เปิดใช้งาน"
+)
+EMBED_PAUSED_ADD = make_embed(
+    "⚠️ ระบบถูกหยุดชั่วคราว", COLOR_WARNING,
+    description="ไม่สามารถเพิ่ม UID ได้ในขณะนี้"
+)
+EMBED_INVALID_DAYS_FORMAT = make_embed(
+    "❌ รูปแบบไม่ถูกต้อง", COLOR_ERROR,
+    description="กรุณากรอกจำนวนวันเป็นตัวเลข"
+)
+EMBED_INVALID_DAYS = make_embed(
+    "❌ จำนวนวันไม่ถูกต้อง", COLOR_ERROR,
+    description="กรุณากรอกจำนวนวันมากกว่า 0"
+)
+EMBED_DEDUCT_FAILED = make_embed(
+    "❌ Points ไม่เพียงพอ", COLOR_ERROR,
+    description="เกิดข้อผิดพลาดในการหัก points"
+)
+EMBED_PAUSED_REMOVE = make_embed(
+    "⚠️ ระบบถูกหยุดชั่วคราว", COLOR_WARNING,
+    description="ไม่สามารถลบ UID ได้ในขณะนี้"
+)
+EMBED_PAUSED_CHANGE = make_embed(
+    "⚠️ ระบบถูกหยุดชั่วคราว", COLOR_WARNING,
+    description="ไม่สามารถเปลี่ยน UID ได้ในขณะนี้"
+)
+EMBED_SAME_UID = make_embed(
+    "❌ ข้อผิดพลาด", COLOR_ERROR,
+    description="UID เก่าและใหม่ต้องไม่เหมือนกัน"
+)
+EMBED_CHANGE_FAILED = make_embed(
+    "❌ เกิดข้อผิดพลาด", COLOR_ERROR,
+    description="ไม่สามารถเปลี่ยน UID ได้"
+)
+EMBED_INVALID_USER_ID = make_embed(
+    "❌ User ID ไม่ถูกต้อง", COLOR_ERROR,
+    description="กรุณากรอก Discord User ID เป็นตัวเลข 17-20 หลัก"
+)
+EMBED_INVALID_POINTS_FORMAT = make_embed(
+    "❌ รูปแบบไม่ถูกต้อง", COLOR_ERROR,
+    description="กรุณากรอกจำนวน Points เป็นตัวเลข"
+)
+EMBED_INVALID_POINTS = make_embed(
+    "❌ จำนวนไม่ถูกต้อง", COLOR_ERROR,
+    description="กรุณาระบุจำนวน Points มากกว่า 0"
+)
+EMBED_INVALID_POINTS_ADDPOINT = make_embed(  # /addpoint keeps its original lowercase wording
+    "❌ จำนวนไม่ถูกต้อง", COLOR_ERROR,
+    description="กรุณาระบุจำนวน points มากกว่า 0"
+)
+EMBED_LIST_EMPTY = make_embed(
+    "📋 รายการ UID", COLOR_INFO,
+    description="ไม่มี UID ในระบบ"
+)
+EMBED_LIST_FAILED = make_embed(
+    "❌ เกิดข้อผิดพลาด", COLOR_ERROR,
+    description="ไม่สามารถแสดงรายการ UID ได้"
+)
+EMBED_SYSTEM_PAUSED = make_embed(
+    "⏸️ หยุดระบบชั่วคราว", COLOR_WARNING,
+    description="ระบบ Whitelist ถูกหยุดชั่วคราวแล้ว",
+    footer="🔴 Whitelist System"
+)
+EMBED_SYSTEM_RESUMED = make_embed(
+    "▶️ เปิดระบบ", COLOR_SUCCESS,
+    description="ระบบ Whitelist กลับมาทำงานแล้ว",
+    footer="🔴 Whitelist System"
+)
+EMBED_SYNC_LOADING = make_embed(
+    "🔄 กำลัง Sync ข้อมูล...", COLOR_INFO,
+    description="กำลังโหลดข้อมูลจาก JSONBin",
+    footer="🔴 Whitelist System"
+)
+
+_POINTS_RATE_FIELD = ("💰 อัตราแลก", f"`{POINTS_PER_DAY}` points = 1 วัน")
+
+def _points_embed(points):
+    """Own-balance embed shared by the My Points button and /mypoints"""
+    # คำนวณว่าเพิ่มได้กี่วัน
+    days_available = points // POINTS_PER_DAY
+    return make_embed(
+        "💳 Points ของคุณ", COLOR_PRIMARY,
+        description=f"คุณมี **{points}** points",
+        fields=(_POINTS_RATE_FIELD, ("📅 เพิ่มได้", f"`{days_available}` วัน")),
+        footer="🔴 Point System"
+    )
 
 # ============================
 # MODALS (INPUT FORMS)
@@ -380,15 +695,16 @@ class CheckUIDModal(ui.Modal, title="🔍 ตรวจสอบ UID"):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        pretty = format_box_date(entry["expiry_date"])
-        embed = discord.Embed(
-            title="📦 ข้อมูล WHITELIST",
-            color=COLOR_PRIMARY
+        embed = make_embed(
+            "📦 ข้อมูล WHITELIST",
+            COLOR_PRIMARY,
+            fields=[
+                ("🔑 UID", f"`{entry['uid']}`", False),
+                ("📅 วันหมดอายุ", f"`{entry['expiry_pretty']}`"),
+                ("📝 หมายเหตุ", f"`{entry.get('comment', '')}`"),
+            ],
+            footer="🔴 Whitelist System"
         )
-        embed.add_field(name="🔑 UID", value=f"`{entry['uid']}`", inline=False)
-        embed.add_field(name="📅 วันหมดอายุ", value=f"`{pretty}`", inline=True)
-        embed.add_field(name="📝 หมายเหตุ", value=f"`{entry['comment']}`", inline=True)
-        embed.set_footer(text="🔴 Whitelist System")
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -414,113 +730,95 @@ class AddUIDModal(ui.Modal, title="➕ เพิ่ม UID"):
     )
     
     async def on_submit(self, interaction: discord.Interaction):
-        global WHITELIST_PAUSED
+        if _PAUSE.is_set():
+            await interaction.response.send_message(embed=EMBED_PAUSED_ADD, ephemeral=True)
+            return
         
-        if WHITELIST_PAUSED:
-            embed = discord.Embed(
-                title="⚠️ ระบบถูกหยุดชั่วคราว",
-                description="ไม่สามารถเพิ่ม UID ได้ในขณะนี้",
-                color=COLOR_WARNING
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        uid = self.uid_input.value.strip()
+        days_text = self.days_input.value.strip()
+        comment = self.comment_input.value.strip()
+        user_id = str(interaction.user.id)
+        
+        days = parse_modal_int(days_text)
+        if days is None:
+            await interaction.response.send_message(embed=EMBED_INVALID_DAYS_FORMAT, ephemeral=True)
             return
         
-        try:
-            uid = self.uid_input.value.strip()
-            days = int(self.days_input.value.strip())
-            comment = self.comment_input.value.strip()
+        if days <= 0:
+            await interaction.response.send_message(embed=EMBED_INVALID_DAYS, ephemeral=True)
+            return
+        
+        # ตรวจสอบและหัก points (ถ้าเปิดใช้งานระบบ points)
+        points_needed = 0
+        remaining_points = 0
+        if POINTS_ENABLED:
+            points_needed = calculate_points_needed(days)
+            current_points = get_user_points(user_id)
             
-            if days <= 0:
+            # ตรวจสอบว่ามี points เพียงพอหรือไม่
+            if current_points < points_needed:
                 embed = discord.Embed(
-                    title="❌ จำนวนวันไม่ถูกต้อง",
-                    description="กรุณากรอกจำนวนวันมากกว่า 0",
+                    title="❌ Points ไม่เพียงพอ",
+                    description=(
+                        f"คุณมี **{current_points}** points\n"
+                        f"ต้องการ **{points_needed}** points ({days} วัน x {POINTS_PER_DAY} points)\n"
+                        f"ขาดอีก **{points_needed - current_points}** points"
+                    ),
                     color=COLOR_ERROR
                 )
                 await interaction.response.send_message(embed=embed, ephemeral=True)
                 return
             
-            # ตรวจสอบและหัก points (ถ้าเปิดใช้งานระบบ points)
-            points_needed = 0
-            remaining_points = 0
-            if POINTS_ENABLED:
-                points_needed = calculate_points_needed(days)
-                user_id = str(interaction.user.id)
-                current_points = get_user_points(user_id)
-                
-                # ตรวจสอบว่ามี points เพียงพอหรือไม่
-                if current_points < points_needed:
-                    embed = discord.Embed(
-                        title="❌ Points ไม่เพียงพอ",
-                        description=(
-                            f"คุณมี **{current_points}** points\n"
-                            f"ต้องการ **{points_needed}** points ({days} วัน x {POINTS_PER_DAY} points)\n"
-                            f"ขาดอีก **{points_needed - current_points}** points"
-                        ),
-                        color=COLOR_ERROR
-                    )
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-                    return
-                
-                # หัก points
-                success_deduct, remaining_points = deduct_user_points(user_id, points_needed)
-                
-                if not success_deduct:
-                    embed = discord.Embed(
-                        title="❌ Points ไม่เพียงพอ",
-                        description="เกิดข้อผิดพลาดในการหัก points",
-                        color=COLOR_ERROR
-                    )
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-                    return
-            
-            # คำนวณวันหมดอายุจากวันนี้ + จำนวนวัน
-            expiry_date = datetime.now() + timedelta(days=days)
-            expiry = expiry_date.strftime("%Y-%m-%d")
-            
-            existing_entry = get_uid_entry(uid)
-            action = "updated" if existing_entry else "added"
+            # หัก points
+            success_deduct, remaining_points = deduct_user_points(user_id, points_needed)
             
-            # ใช้ cache ทำให้เร็วมาก (sync ไป JSONBin ใน background)
-            success = add_uid_entry(uid, expiry, comment)
+            if not success_deduct:
+                await interaction.response.send_message(embed=EMBED_DEDUCT_FAILED, ephemeral=True)
+                return
+        
+        # คำนวณวันหมดอายุจากวันนี้ + จำนวนวัน
+        expiry_date = datetime.now() + timedelta(days=days)
+        expiry = expiry_date.strftime("%Y-%m-%d")
+        
+        # ใช้ cache ทำให้เร็วมาก (sync ไป JSONBin ใน background)
+        new_entry, was_update = add_uid_entry(uid, expiry, comment)
+        
+        if new_entry:
+            fields = [
+                ("📅 วันหมดอายุ", f"`{new_entry['expiry_pretty']}`"),
+                ("⏱️ จำนวนวัน", f"`{days} วัน`"),
+                ("📝 หมายเหตุ", f"`{comment}`"),
+            ]
+            if POINTS_ENABLED:
+                fields.append(("💰 หัก Points", f"`-{points_needed}`"))
+                fields.append(("💳 คงเหลือ", f"`{remaining_points}` points"))
             
-            if success:
-                if action == "added":
-                    embed = discord.Embed(
-                        title="✅ เพิ่ม UID สำเร็จ",
-                        description=f"UID `{uid}` ถูกเพิ่มเรียบร้อยแล้ว",
-                        color=COLOR_SUCCESS
-                    )
-                else:
-                    embed = discord.Embed(
-                        title="🔄 อัพเดท UID สำเร็จ",
-                        description=f"UID `{uid}` ถูกอัพเดทเรียบร้อยแล้ว",
-                        color=COLOR_WARNING
-                    )
-                embed.add_field(name="📅 วันหมดอายุ", value=f"`{format_box_date(expiry)}`", inline=True)
-                embed.add_field(name="⏱️ จำนวนวัน", value=f"`{days} วัน`", inline=True)
-                embed.add_field(name="📝 หมายเหตุ", value=f"`{comment}`", inline=True)
-                if POINTS_ENABLED:
-                    embed.add_field(name="💰 หัก Points", value=f"`-{points_needed}`", inline=True)
-                    embed.add_field(name="💳 คงเหลือ", value=f"`{remaining_points}` points", inline=True)
-                embed.set_footer(text="🔴 Whitelist System")
-                
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                await send_log(interaction.client, "ADD", uid, interaction.user, expiry, comment)
+            if not was_update:
+                embed = make_embed(
+                    "✅ เพิ่ม UID สำเร็จ",
+                    COLOR_SUCCESS,
+                    description=f"UID `{uid}` ถูกเพิ่มเรียบร้อยแล้ว",
+                    fields=fields,
+                    footer="🔴 Whitelist System"
+                )
             else:
-                # คืน points ถ้าเพิ่ม UID ไม่สำเร็จ
-                if POINTS_ENABLED:
-                    add_user_points(str(interaction.user.id), points_needed)
-                embed = discord.Embed(
-                    title="❌ เกิดข้อผิดพลาด",
-                    description="ไม่สามารถบันทึกข้อมูลได้" + (" (points ถูกคืนแล้ว)" if POINTS_ENABLED else ""),
-                    color=COLOR_ERROR
+                embed = make_embed(
+                    "🔄 อัพเดท UID สำเร็จ",
+                    COLOR_WARNING,
+                    description=f"UID `{uid}` ถูกอัพเดทเรียบร้อยแล้ว",
+                    fields=fields,
+                    footer="🔴 Whitelist System"
                 )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                
-        except ValueError:
+            
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            _spawn_task(send_log(interaction.client, "ADD", uid, interaction.user, expiry, comment))
+        else:
+            # คืน points ถ้าเพิ่ม UID ไม่สำเร็จ
+            if POINTS_ENABLED:
+                add_user_points(user_id, points_needed)
             embed = discord.Embed(
-                title="❌ รูปแบบไม่ถูกต้อง",
-                description="กรุณากรอกจำนวนวันเป็นตัวเลข",
+                title="❌ เกิดข้อผิดพลาด",
+                description="ไม่สามารถบันทึกข้อมูลได้" + (" (points ถูกคืนแล้ว)" if POINTS_ENABLED else ""),
                 color=COLOR_ERROR
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -535,15 +833,8 @@ class RemoveUIDModal(ui.Modal, title="🗑️ ลบ UID"):
     )
     
     async def on_submit(self, interaction: discord.Interaction):
-        global WHITELIST_PAUSED
-        
-        if WHITELIST_PAUSED:
-            embed = discord.Embed(
-                title="⚠️ ระบบถูกหยุดชั่วคราว",
-                description="ไม่สามารถลบ UID ได้ในขณะนี้",
-                color=COLOR_WARNING
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if _PAUSE.is_set():
+            await interaction.response.send_message(embed=EMBED_PAUSED_REMOVE, ephemeral=True)
             return
         
         uid = self.uid_input.value.strip()
@@ -552,14 +843,14 @@ class RemoveUIDModal(ui.Modal, title="🗑️ ลบ UID"):
         success = remove_uid_entry(uid)
         
         if success:
-            embed = discord.Embed(
-                title="🗑️ ลบ UID สำเร็จ",
+            embed = make_embed(
+                "🗑️ ลบ UID สำเร็จ",
+                COLOR_SUCCESS,
                 description=f"UID `{uid}` ถูกลบเรียบร้อยแล้ว",
-                color=COLOR_SUCCESS
+                footer="🔴 Whitelist System"
             )
-            embed.set_footer(text="🔴 Whitelist System")
             await interaction.response.send_message(embed=embed, ephemeral=True)
-            await send_log(interaction.client, "REMOVE", uid, interaction.user)
+            _spawn_task(send_log(interaction.client, "REMOVE", uid, interaction.user))
         else:
             embed = discord.Embed(
                 title="❌ ไม่พบ UID",
@@ -584,41 +875,29 @@ class ChangeUIDModal(ui.Modal, title="🔄 เปลี่ยน UID"):
     )
     
     async def on_submit(self, interaction: discord.Interaction):
-        global WHITELIST_PAUSED
-        
-        if WHITELIST_PAUSED:
-            embed = discord.Embed(
-                title="⚠️ ระบบถูกหยุดชั่วคราว",
-                description="ไม่สามารถเปลี่ยน UID ได้ในขณะนี้",
-                color=COLOR_WARNING
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if _PAUSE.is_set():
+            await interaction.response.send_message(embed=EMBED_PAUSED_CHANGE, ephemeral=True)
             return
         
         old_uid = self.old_uid_input.value.strip()
         new_uid = self.new_uid_input.value.strip()
         
         if old_uid == new_uid:
-            embed = discord.Embed(
-                title="❌ ข้อผิดพลาด",
-                description="UID เก่าและใหม่ต้องไม่เหมือนกัน",
-                color=COLOR_ERROR
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=EMBED_SAME_UID, ephemeral=True)
             return
         
         # ใช้ cache ทำให้เร็วมาก (sync ไป JSONBin ใน background)
         success, status = change_uid_entry(old_uid, new_uid)
         
         if success:
-            embed = discord.Embed(
-                title="✅ เปลี่ยน UID สำเร็จ",
+            embed = make_embed(
+                "✅ เปลี่ยน UID สำเร็จ",
+                COLOR_SUCCESS,
                 description=f"เปลี่ยน UID จาก `{old_uid}` เป็น `{new_uid}` เรียบร้อยแล้ว",
-                color=COLOR_SUCCESS
+                footer="🔴 Whitelist System"
             )
-            embed.set_footer(text="🔴 Whitelist System")
             await interaction.response.send_message(embed=embed, ephemeral=True)
-            await send_log(interaction.client, "CHANGE", new_uid, interaction.user, old_uid=old_uid)
+            _spawn_task(send_log(interaction.client, "CHANGE", new_uid, interaction.user, old_uid=old_uid))
         else:
             if status == "OLD_UID_NOT_FOUND":
                 embed = discord.Embed(
@@ -633,11 +912,7 @@ class ChangeUIDModal(ui.Modal, title="🔄 เปลี่ยน UID"):
                     color=COLOR_ERROR
                 )
             else:
-                embed = discord.Embed(
-                    title="❌ เกิดข้อผิดพลาด",
-                    description="ไม่สามารถเปลี่ยน UID ได้",
-                    color=COLOR_ERROR
-                )
+                embed = EMBED_CHANGE_FAILED
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
@@ -660,54 +935,101 @@ class AddPointsModal(ui.Modal, title="💰 เพิ่ม Points"):
     
     async def on_submit(self, interaction: discord.Interaction):
         if not POINTS_ENABLED:
-            embed = discord.Embed(
-                title="⚠️ ระบบ Points ไม่เปิดใช้งาน",
-                description="กรุณาตั้งค่า POINTS_URL ใน .env",
-                color=COLOR_WARNING
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=EMBED_POINTS_DISABLED, ephemeral=True)
             return
         
-        try:
-            user_id = self.user_id_input.value.strip()
-            amount = int(self.amount_input.value.strip())
-            
-            if amount <= 0:
-                embed = discord.Embed(
-                    title="❌ จำนวนไม่ถูกต้อง",
-                    description="กรุณาระบุจำนวน Points มากกว่า 0",
-                    color=COLOR_ERROR
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-            
-            new_balance = add_user_points(user_id, amount)
-            
-            embed = discord.Embed(
-                title="✅ เพิ่ม Points สำเร็จ",
-                description=f"เพิ่ม **{amount}** points ให้ User ID: `{user_id}`",
-                color=COLOR_SUCCESS
-            )
-            embed.add_field(name="💰 เพิ่ม", value=f"`+{amount}` points", inline=True)
-            embed.add_field(name="💳 คงเหลือ", value=f"`{new_balance}` points", inline=True)
-            embed.set_footer(text="🔴 Point System")
-            
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            await send_simple_log(interaction.client, f"💰 **ADD POINTS** | {interaction.user.name} added {amount} points to {user_id} (Total: {new_balance})")
-            
-        except ValueError:
-            embed = discord.Embed(
-                title="❌ รูปแบบไม่ถูกต้อง",
-                description="กรุณากรอกจำนวน Points เป็นตัวเลข",
-                color=COLOR_ERROR
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        user_id = self.user_id_input.value.strip()
+        amount_text = self.amount_input.value.strip()
+        
+        if not is_ascii_digits(user_id, 20, min_len=17):
+            await interaction.response.send_message(embed=EMBED_INVALID_USER_ID, ephemeral=True)
+            return
+        
+        amount = parse_modal_int(amount_text)
+        if amount is None:
+            await interaction.response.send_message(embed=EMBED_INVALID_POINTS_FORMAT, ephemeral=True)
+            return
+        
+        if amount <= 0:
+            await interaction.response.send_message(embed=EMBED_INVALID_POINTS, ephemeral=True)
+            return
+        
+        new_balance = add_user_points(user_id, amount)
+        
+        embed = discord.Embed(
+            title="✅ เพิ่ม Points สำเร็จ",
+            description=f"เพิ่ม **{amount}** points ให้ User ID: `{user_id}`",
+            color=COLOR_SUCCESS
+        )
+        embed.add_field(name="💰 เพิ่ม", value=f"`+{amount}` points", inline=True)
+        embed.add_field(name="💳 คงเหลือ", value=f"`{new_balance}` points", inline=True)
+        embed.set_footer(text="🔴 Point System")
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        _spawn_task(send_simple_log(interaction.client, f"💰 **ADD POINTS** | {interaction.user.name} added {amount} points to {user_id} (Total: {new_balance})"))
 
 
 # ============================
 # MAIN MENU VIEW (BUTTONS)
 # ============================
 
+# 5 blocks x 1000 chars stays under Discord's 6000-char / 25-field embed limits
+LIST_FIELDS_PER_PAGE = 5
+
+class PaginatedListView(ui.View):
+    """Prev/Next pages over the pre-rendered list blocks (one embed page per click)"""
+
+    def __init__(self, fields, total):
+        super().__init__(timeout=300)
+        # The cached block list is replaced (never mutated) on cache changes,
+        # so holding it keeps this view's pages consistent
+        self.fields = fields
+        self.total = total
+        self.page = 0
+        self.page_count = (len(fields) + LIST_FIELDS_PER_PAGE - 1) // LIST_FIELDS_PER_PAGE
+        # Latest interaction on the message; its token (valid 15 min) is used to
+        # disable the buttons once the view times out
+        self.interaction = None
+        self._update_buttons()
+
+    def render(self):
+        start = self.page * LIST_FIELDS_PER_PAGE
+        return make_embed(
+            "📋 รายการ UID ทั้งหมด",
+            COLOR_PRIMARY,
+            fields=[("📦 UIDs", value, False) for value in self.fields[start:start + LIST_FIELDS_PER_PAGE]],
+            footer=f"🔴 ทั้งหมด {self.total} รายการ | หน้า {self.page + 1}/{self.page_count}"
+        )
+
+    def _update_buttons(self):
+        self.prev_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= self.page_count - 1
+
+    async def on_timeout(self):
+        for child in self.children:
+            child.disabled = True
+        if self.interaction is None:
+            return
+        try:
+            await self.interaction.edit_original_response(view=self)
+        except discord.HTTPException as e:
+            # The ephemeral message may already be dismissed
+            print(f"[LIST] Error disabling list pages: {e}")
+
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        self.interaction = interaction
+        self.page = page
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    @ui.button(label="◀️ ก่อนหน้า", style=discord.ButtonStyle.secondary)
+    async def prev_button(self, interaction: discord.Interaction, button: ui.Button):
+        await self._show_page(interaction, max(self.page - 1, 0))
+
+    @ui.button(label="ถัดไป ▶️", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: ui.Button):
+        await self._show_page(interaction, min(self.page + 1, self.page_count - 1))
+
 class MainMenuView(ui.View):
     def __init__(self):
         super().__init__(timeout=None)
@@ -719,46 +1041,34 @@ class MainMenuView(ui.View):
     @ui.button(label="📋 ดู UID ทั้งหมด", style=discord.ButtonStyle.danger, custom_id="list_uids", row=0)
     async def list_uids_button(self, interaction: discord.Interaction, button: ui.Button):
         # ใช้ cache ทำให้เร็วมาก ไม่ต้อง defer
-        try:
-            data = get_all_uids()
-            
-            if not data:
-                embed = discord.Embed(
-                    title="📋 รายการ UID",
-                    description="ไม่มี UID ในระบบ",
-                    color=COLOR_INFO
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-            
-            embed = discord.Embed(
-                title="📋 รายการ UID ทั้งหมด",
-                color=COLOR_PRIMARY
-            )
-            
-            # แบ่งเป็นหลาย field ถ้ามีข้อมูลมาก
-            uid_list = ""
-            for i, entry in enumerate(data):
-                line = f"`{entry['uid']}` - {format_box_date(entry['expiry_date'])} - {entry['comment']}\n"
-                if len(uid_list) + len(line) > 1000:
-                    embed.add_field(name="📦 UIDs", value=uid_list, inline=False)
-                    uid_list = line
-                else:
-                    uid_list += line
-            
-            if uid_list:
-                embed.add_field(name="📦 UIDs", value=uid_list, inline=False)
-            
-            embed.set_footer(text=f"🔴 ทั้งหมด {len(data)} รายการ")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            
-        except Exception as e:
-            embed = discord.Embed(
-                title="❌ เกิดข้อผิดพลาด",
-                description="ไม่สามารถเชื่อมต่อฐานข้อมูลได้",
-                color=COLOR_ERROR
+        data = get_all_uids()
+        
+        if not data:
+            await interaction.response.send_message(embed=EMBED_LIST_EMPTY, ephemeral=True)
+            return
+        
+        # แบ่งเป็นหลายหน้า หน้าละหลาย field (render ไว้แล้วใน cache)
+        fields = get_list_fields()
+        if len(fields) > LIST_FIELDS_PER_PAGE:
+            view = PaginatedListView(fields, len(data))
+            view.interaction = interaction
+            embed = view.render()
+        else:
+            view = discord.utils.MISSING
+            embed = make_embed(
+                "📋 รายการ UID ทั้งหมด",
+                COLOR_PRIMARY,
+                fields=[("📦 UIDs", value, False) for value in fields],
+                footer=f"🔴 ทั้งหมด {len(data)} รายการ"
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        
+        try:
+            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        except discord.HTTPException as e:
+            # Discord rejected the embed (e.g. an unusually long line pushing a page past
+            # the size limit); the response is still unused, so report it instead
+            print(f"[LIST] Error sending UID list: {e}")
+            await interaction.response.send_message(embed=EMBED_LIST_FAILED, ephemeral=True)
     
     @ui.button(label="➕ เพิ่ม UID", style=discord.ButtonStyle.danger, custom_id="add_uid", row=1)
     async def add_uid_button(self, interaction: discord.Interaction, button: ui.Button):
@@ -774,61 +1084,30 @@ class MainMenuView(ui.View):
     
     @ui.button(label="⏸️ หยุดระบบ", style=discord.ButtonStyle.secondary, custom_id="pause_system", row=2)
     async def pause_button(self, interaction: discord.Interaction, button: ui.Button):
-        global WHITELIST_PAUSED
-        
-        if interaction.user.id != DEV_ID:
-            embed = discord.Embed(
-                title="❌ ไม่มีสิทธิ์",
-                description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถหยุดระบบได้",
-                color=COLOR_ERROR
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if interaction.user.id not in ADMIN_IDS:
+            await interaction.response.send_message(embed=EMBED_NO_PERMISSION_PAUSE, ephemeral=True)
             return
         
-        WHITELIST_PAUSED = True
-        embed = discord.Embed(
-            title="⏸️ หยุดระบบชั่วคราว",
-            description="ระบบ Whitelist ถูกหยุดชั่วคราวแล้ว",
-            color=COLOR_WARNING
-        )
-        embed.set_footer(text="🔴 Whitelist System")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        await send_log(interaction.client, "PAUSE", "", interaction.user)
+        _PAUSE.set()
+        await interaction.response.send_message(embed=EMBED_SYSTEM_PAUSED, ephemeral=True)
+        _spawn_task(send_log(interaction.client, "PAUSE", "", interaction.user))
     
     @ui.button(label="▶️ เปิดระบบ", style=discord.ButtonStyle.secondary, custom_id="resume_system", row=2)
     async def resume_button(self, interaction: discord.Interaction, button: ui.Button):
-        global WHITELIST_PAUSED
-        
-        if interaction.user.id != DEV_ID:
-            embed = discord.Embed(
-                title="❌ ไม่มีสิทธิ์",
-                description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถเปิดระบบได้",
-                color=COLOR_ERROR
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if interaction.user.id not in ADMIN_IDS:
+            await interaction.response.send_message(embed=EMBED_NO_PERMISSION_RESUME, ephemeral=True)
             return
         
-        WHITELIST_PAUSED = False
-        embed = discord.Embed(
-            title="▶️ เปิดระบบ",
-            description="ระบบ Whitelist กลับมาทำงานแล้ว",
-            color=COLOR_SUCCESS
-        )
-        embed.set_footer(text="🔴 Whitelist System")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        await send_log(interaction.client, "RESUME", "", interaction.user)
+        _PAUSE.clear()
+        await interaction.response.send_message(embed=EMBED_SYSTEM_RESUMED, ephemeral=True)
+        _spawn_task(send_log(interaction.client, "RESUME", "", interaction.user))
     
     @ui.button(label="💰 เพิ่ม Points", style=discord.ButtonStyle.success, custom_id="add_points", row=3)
     async def add_points_button(self, interaction: discord.Interaction, button: ui.Button):
         """Add points to a user (Server Owner only)"""
         # ตรวจสอบว่าเป็นเจ้าของเซิร์ฟเวอร์หรือไม่
         if interaction.guild is None or interaction.user.id != interaction.guild.owner_id:
-            embed = discord.Embed(
-                title="❌ ไม่มีสิทธิ์",
-                description="เฉพาะเจ้าของเซิร์ฟเวอร์เท่านั้นที่สามารถเพิ่ม Points ได้",
-                color=COLOR_ERROR
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=EMBED_NO_PERMISSION_SERVER_OWNER, ephemeral=True)
             return
         
         await interaction.response.send_modal(AddPointsModal())
@@ -837,50 +1116,34 @@ class MainMenuView(ui.View):
     async def my_points_button(self, interaction: discord.Interaction, button: ui.Button):
         """Show user's points balance"""
         if not POINTS_ENABLED:
-            embed = discord.Embed(
-                title="⚠️ ระบบ Points ไม่เปิดใช้งาน",
-                description="ระบบ Points ไม่ได้เปิดใช้งาน",
-                color=COLOR_WARNING
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=EMBED_POINTS_DISABLED_USER, ephemeral=True)
             return
         
-        user_id = str(interaction.user.id)
-        points = get_user_points(user_id)
-        days_available = points // POINTS_PER_DAY
-        
-        embed = discord.Embed(
-            title="💳 Points ของคุณ",
-            description=f"คุณมี **{points}** points",
-            color=COLOR_PRIMARY
-        )
-        embed.add_field(name="💰 อัตราแลก", value=f"`{POINTS_PER_DAY}` points = 1 วัน", inline=True)
-        embed.add_field(name="📅 เพิ่มได้", value=f"`{days_available}` วัน", inline=True)
-        embed.set_footer(text="🔴 Point System")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        points = get_user_points(str(interaction.user.id))
+        await interaction.response.send_message(embed=_points_embed(points), ephemeral=True)
     
     @ui.button(label="🔄 Sync ข้อมูล", style=discord.ButtonStyle.secondary, custom_id="force_sync", row=3)
     async def force_sync_button(self, interaction: discord.Interaction, button: ui.Button):
         """Force sync data from JSONBin to refresh cache"""
-        if interaction.user.id != DEV_ID:
-            embed = discord.Embed(
-                title="❌ ไม่มีสิทธิ์",
-                description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถ Sync ข้อมูลได้",
-                color=COLOR_ERROR
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if interaction.user.id not in ADMIN_IDS:
+            await interaction.response.send_message(embed=EMBED_NO_PERMISSION_SYNC, ephemeral=True)
             return
         
-        # Defer because this calls JSONBin
-        await interaction.response.defer(ephemeral=True)
+        # Acknowledge right away with a loading message, then edit it in place once JSONBin answers
+        await interaction.response.send_message(embed=EMBED_SYNC_LOADING, ephemeral=True)
         
-        success = load_cache_from_jsonbin()
+        success, status = await load_cache_from_jsonbin()
         
-        if success:
+        if status == "NOT_MODIFIED":
+            embed = discord.Embed(
+                title="✅ ข้อมูลเป็นปัจจุบันแล้ว",
+                description=f"ข้อมูลบน JSONBin ไม่มีการเปลี่ยนแปลง ({len(WHITELIST_INDEX)} รายการ)",
+                color=COLOR_SUCCESS
+            )
+        elif success:
             embed = discord.Embed(
                 title="✅ Sync สำเร็จ",
-                description=f"โหลดข้อมูล {len(WHITELIST_CACHE)} รายการจาก JSONBin",
+                description=f"โหลดข้อมูล {len(WHITELIST_INDEX)} รายการจาก JSONBin",
                 color=COLOR_SUCCESS
             )
         else:
@@ -890,7 +1153,10 @@ class MainMenuView(ui.View):
                 color=COLOR_ERROR
             )
         embed.set_footer(text="🔴 Whitelist System")
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        await interaction.edit_original_response(embed=embed)
+
+# Persistent (timeout=None) singleton, built in setup_hook because View needs a running loop
+MAIN_MENU_VIEW = None
 
 
 # ============================
@@ -900,23 +1166,14 @@ class MyBot(discord.Client):
     def __init__(self):
         super().__init__(intents=discord.Intents.default())
         self.tree = app_commands.CommandTree(self)
+        self.sync_task = None
 
     async def on_ready(self):
+        global _LOG_CHANNEL
         print(f"[READY] Logged in as {self.user}")
         
-        # Load cache from JSONBin at startup
-        print("[STARTUP] Loading cache from JSONBin...")
-        load_cache_from_jsonbin()
-        
-        # Load points from storage (if enabled)
-        if POINTS_ENABLED:
-            print("[STARTUP] Loading points from storage...")
-            load_points_from_storage()
-        else:
-            print("[STARTUP] Points system is disabled (POINTS_URL not set)")
-        
-        # Register persistent view
-        self.add_view(MainMenuView())
+        if LOG_CHANNEL_ID:
+            _LOG_CHANNEL = self.get_channel(LOG_CHANNEL_ID)
         
         try:
             cmds = await self.tree.sync()
@@ -926,13 +1183,75 @@ class MyBot(discord.Client):
             print(f"Error syncing commands: {e}")
 
     async def setup_hook(self):
+        global AIOHTTP_SESSION, MAIN_MENU_VIEW
         print("[SETUP] Bot is starting up...")
+        
+        # Register the persistent view once; /menu reuses the same instance
+        MAIN_MENU_VIEW = MainMenuView()
+        self.add_view(MAIN_MENU_VIEW)
+        AIOHTTP_SESSION = aiohttp.ClientSession(
+            headers=JSONBIN_HEADERS,
+            connector=aiohttp.TCPConnector(
+                limit=IO_CONCURRENCY,
+                limit_per_host=IO_CONCURRENCY,
+                ttl_dns_cache=600,  # storage hosts don't move; skip re-resolving every 10 s
+                keepalive_timeout=120  # keep the TLS connection warm between bursts of edits
+            )
+        )
+        
+        # Load whitelist and points concurrently so startup waits for one round trip
+        print("[STARTUP] Loading cache from JSONBin...")
+        loaders = [load_cache_from_jsonbin()]
+        if POINTS_ENABLED:
+            print("[STARTUP] Loading points from storage...")
+            loaders.append(load_points_from_storage())
+        else:
+            print("[STARTUP] Points system is disabled (POINTS_URL not set)")
+        await asyncio.gather(*loaders)
+        
+        self.sync_task = _spawn_task(sync_worker())
+
+    async def close(self):
+        # Stop the worker first so no PUT is still in flight when the session closes;
+        # a PUT it aborts stays pending and is pushed again by the flush below
+        if self.sync_task is not None:
+            self.sync_task.cancel()
+            try:
+                await self.sync_task
+            except asyncio.CancelledError:
+                pass
+        if AIOHTTP_SESSION is not None:
+            await flush_pending_syncs()
+            await AIOHTTP_SESSION.close()
+        await super().close()
 
 bot = MyBot()
 
 # ============================
 # /menu COMMAND
 # ============================
+# Static menu embed, built once and reused by every /menu call
+MENU_EMBED = discord.Embed(
+    title="🔴 WHITELIST SYSTEM",
+    description=(
+        "ยินดีต้อนรับสู่ระบบ Whitelist\n"
+        "กรุณาเลือกฟังก์ชันที่ต้องการจากปุ่มด้านล่าง\n\n"
+        "🔍 **ตรวจสอบ UID** - ค้นหาข้อมูล UID\n"
+        "📋 **ดู UID ทั้งหมด** - แสดงรายการ UID ทั้งหมด\n"
+        "➕ **เพิ่ม UID** - เพิ่ม UID (หัก Points)\n"
+        "🔄 **เปลี่ยน UID** - เปลี่ยน UID เก่าเป็น UID ใหม่\n"
+        "🗑️ **ลบ UID** - ลบ UID ออกจากระบบ\n"
+        "⏸️ **หยุดระบบ** - หยุดระบบชั่วคราว (Owner)\n"
+        "▶️ **เปิดระบบ** - เปิดระบบอีกครั้ง (Owner)\n"
+        "💰 **เพิ่ม Points** - เพิ่ม Points ให้ User (Server Owner)\n"
+        "💳 **Points ของฉัน** - ดู Points คงเหลือ\n"
+        "🔄 **Sync ข้อมูล** - โหลดข้อมูลใหม่ (Owner)\n\n"
+        f"**อัตราแลก:** `{POINTS_PER_DAY}` points = 1 วัน"
+    ),
+    color=COLOR_PRIMARY
+)
+MENU_EMBED.set_footer(text="🔴 Whitelist System | Point-Based")
+
 @bot.tree.command(name="menu", description="แสดงเมนูหลัก Whitelist System")
 async def menu_cmd(interaction: discord.Interaction):
     if ALLOWED_CHANNEL and interaction.channel_id != ALLOWED_CHANNEL:
@@ -942,28 +1261,7 @@ async def menu_cmd(interaction: discord.Interaction):
         )
         return
     
-    embed = discord.Embed(
-        title="🔴 WHITELIST SYSTEM",
-        description=(
-            "ยินดีต้อนรับสู่ระบบ Whitelist\n"
-            "กรุณาเลือกฟังก์ชันที่ต้องการจากปุ่มด้านล่าง\n\n"
-            "🔍 **ตรวจสอบ UID** - ค้นหาข้อมูล UID\n"
-            "📋 **ดู UID ทั้งหมด** - แสดงรายการ UID ทั้งหมด\n"
-            "➕ **เพิ่ม UID** - เพิ่ม UID (หัก Points)\n"
-            "🔄 **เปลี่ยน UID** - เปลี่ยน UID เก่าเป็น UID ใหม่\n"
-            "🗑️ **ลบ UID** - ลบ UID ออกจากระบบ\n"
-            "⏸️ **หยุดระบบ** - หยุดระบบชั่วคราว (Owner)\n"
-            "▶️ **เปิดระบบ** - เปิดระบบอีกครั้ง (Owner)\n"
-            "💰 **เพิ่ม Points** - เพิ่ม Points ให้ User (Server Owner)\n"
-            "💳 **Points ของฉัน** - ดู Points คงเหลือ\n"
-            "🔄 **Sync ข้อมูล** - โหลดข้อมูลใหม่ (Owner)\n\n"
-            f"**อัตราแลก:** `{POINTS_PER_DAY}` points = 1 วัน"
-        ),
-        color=COLOR_PRIMARY
-    )
-    embed.set_footer(text="🔴 Whitelist System | Point-Based")
-    
-    await interaction.response.send_message(embed=embed, view=MainMenuView())
+    await interaction.response.send_message(embed=MENU_EMBED, view=MAIN_MENU_VIEW)
 
 
 # ============================
@@ -976,30 +1274,15 @@ async def menu_cmd(interaction: discord.Interaction):
 )
 async def addpoint_cmd(interaction: discord.Interaction, user: discord.User, amount: int):
     if not POINTS_ENABLED:
-        embed = discord.Embed(
-            title="⚠️ ระบบ Points ไม่เปิดใช้งาน",
-            description="กรุณาตั้งค่า POINTS_URL ใน .env",
-            color=COLOR_WARNING
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=EMBED_POINTS_DISABLED, ephemeral=True)
         return
     
-    if interaction.user.id != DEV_ID:
-        embed = discord.Embed(
-            title="❌ ไม่มีสิทธิ์",
-            description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถเพิ่ม points ได้",
-            color=COLOR_ERROR
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    if interaction.user.id not in ADMIN_IDS:
+        await interaction.response.send_message(embed=EMBED_NO_PERMISSION_ADD_POINTS, ephemeral=True)
         return
     
     if amount <= 0:
-        embed = discord.Embed(
-            title="❌ จำนวนไม่ถูกต้อง",
-            description="กรุณาระบุจำนวน points มากกว่า 0",
-            color=COLOR_ERROR
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=EMBED_INVALID_POINTS_ADDPOINT, ephemeral=True)
         return
     
     new_balance = add_user_points(str(user.id), amount)
@@ -1015,7 +1298,7 @@ async def addpoint_cmd(interaction: discord.Interaction, user: discord.User, amo
     embed.set_footer(text="🔴 Point System")
     
     await interaction.response.send_message(embed=embed)
-    await send_simple_log(bot, f"💰 **ADD POINTS** | {interaction.user.name} added {amount} points to {user.name} (Total: {new_balance})")
+    _spawn_task(send_simple_log(bot, f"💰 **ADD POINTS** | {interaction.user.name} added {amount} points to {user.name} (Total: {new_balance})"))
 
 # ============================
 # /mypoints COMMAND
@@ -1023,30 +1306,11 @@ async def addpoint_cmd(interaction: discord.Interaction, user: discord.User, amo
 @bot.tree.command(name="mypoints", description="ดู points ของตัวเอง")
 async def mypoints_cmd(interaction: discord.Interaction):
     if not POINTS_ENABLED:
-        embed = discord.Embed(
-            title="⚠️ ระบบ Points ไม่เปิดใช้งาน",
-            description="กรุณาตั้งค่า POINTS_URL ใน .env",
-            color=COLOR_WARNING
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=EMBED_POINTS_DISABLED, ephemeral=True)
         return
     
-    user_id = str(interaction.user.id)
-    points = get_user_points(user_id)
-    
-    embed = discord.Embed(
-        title="💳 Points ของคุณ",
-        description=f"คุณมี **{points}** points",
-        color=COLOR_PRIMARY
-    )
-    embed.add_field(name="💰 อัตราแลก", value=f"`{POINTS_PER_DAY}` points = 1 วัน", inline=True)
-    
-    # คำนวณว่าเพิ่มได้กี่วัน
-    days_available = points // POINTS_PER_DAY
-    embed.add_field(name="📅 เพิ่มได้", value=f"`{days_available}` วัน", inline=True)
-    embed.set_footer(text="🔴 Point System")
-    
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    points = get_user_points(str(interaction.user.id))
+    await interaction.response.send_message(embed=_points_embed(points), ephemeral=True)
 
 # ============================
 # /checkpoints COMMAND (Owner only)
@@ -1055,21 +1319,11 @@ async def mypoints_cmd(interaction: discord.Interaction):
 @app_commands.describe(user="ผู้ใช้ที่ต้องการตรวจสอบ")
 async def checkpoints_cmd(interaction: discord.Interaction, user: discord.User):
     if not POINTS_ENABLED:
-        embed = discord.Embed(
-            title="⚠️ ระบบ Points ไม่เปิดใช้งาน",
-            description="กรุณาตั้งค่า POINTS_URL ใน .env",
-            color=COLOR_WARNING
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=EMBED_POINTS_DISABLED, ephemeral=True)
         return
     
-    if interaction.user.id != DEV_ID:
-        embed = discord.Embed(
-            title="❌ ไม่มีสิทธิ์",
-            description="เฉพาะเจ้าของบอทเท่านั้นที่สามารถดู points ของผู้อื่นได้",
-            color=COLOR_ERROR
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    if interaction.user.id not in ADMIN_IDS:
+        await interaction.response.send_message(embed=EMBED_NO_PERMISSION_CHECK_POINTS, ephemeral=True)
         return
     
     user_id = str(user.id)
@@ -1091,4 +1345,11 @@ async def checkpoints_cmd(interaction: discord.Interaction, user: discord.User):
 # RUN BOT
 # ============================
 if __name__ == "__main__":
+    # libuv-based event loop: faster task switching and socket I/O for discord.py + aiohttp.
+    # Optional (not available on Windows); falls back to the default asyncio loop.
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     bot.run(BOT_TOKEN)